@@ -9,6 +9,7 @@ but will deal with unit conversions internally.
 
 # Standard library
 import re
+import sys
 import numbers
 from fractions import Fraction
 import warnings
@@ -28,9 +29,9 @@ from astropy.utils.data_info import ParentDtypeInfo
 from astropy import config as _config
 from .quantity_helper import (converters_and_unit, can_have_arbitrary_unit,
                               check_output)
+from .quantity_helper import function_helpers
 from .quantity_helper.function_helpers import (
-    SUBCLASS_SAFE_FUNCTIONS, FUNCTION_HELPERS, DISPATCHED_FUNCTIONS,
-    UNSUPPORTED_FUNCTIONS)
+    _HELPER_TABLE, KIND_SUBCLASS_SAFE, KIND_HELPER, KIND_DISPATCHED)
 
 
 __all__ = ["Quantity", "SpecificTypeQuantity",
@@ -640,7 +641,13 @@ class Quantity(np.ndarray):
         # http://www.mail-archive.com/numpy-discussion@scipy.org/msg02446.html
 
         object_state = list(super().__reduce__())
-        object_state[2] = (object_state[2], self.__dict__)
+        own_state = self.__dict__
+        if '_ndarray_view' in own_state:
+            # Do not pickle the plain view cached by the function helpers;
+            # it would duplicate all the data (and is easily recreated).
+            own_state = {key: value for key, value in own_state.items()
+                         if key != '_ndarray_view'}
+        object_state[2] = (object_state[2], own_state)
         return tuple(object_state)
 
     def __setstate__(self, state):
@@ -1407,10 +1414,25 @@ class Quantity(np.ndarray):
     def fill(self, value):
         self.view(np.ndarray).fill(self._to_own_unit(value))
 
-    # Shape manipulation: resize cannot be done (does not own data), but
-    # shape, transpose, swapaxes, flatten, ravel, squeeze all OK.  Only
+    # Shape manipulation: resize needs care, since the plain view that
+    # the function helpers may have cached references our data buffer and
+    # would make the refcheck done by ndarray.resize fail; shape,
+    # transpose, swapaxes, flatten, ravel, squeeze all OK.  Only
     # the flat iterator needs to be overwritten, otherwise single items are
     # returned as numbers.
+    def resize(self, *new_shape, refcheck=True):
+        self.__dict__.pop('_ndarray_view', None)
+        if refcheck and sys.getrefcount(self) > 3:
+            # Mirrors the check in ndarray.resize; it has to be done here
+            # since delegating with refcheck=True would always fail: this
+            # frame itself holds an extra reference to self.  The clean
+            # case is 3: the caller's variable, our 'self', and the
+            # temporary reference getrefcount itself creates.
+            raise ValueError(
+                "cannot resize an array that references or is referenced "
+                "by another array in this way. Use the np.resize function "
+                "or refcheck=False")
+        super().resize(*new_shape, refcheck=False)
     @property
     def flat(self):
         """A 1-D iterator over the Quantity array.
@@ -1488,7 +1510,8 @@ class Quantity(np.ndarray):
         ~astropy.units.UnitsError
             If operands have incompatible units.
         """
-        # A function should be in one of the following sets or dicts:
+        # A function should be in one of the following sets or dicts
+        # (collected in _HELPER_TABLE, so that a single lookup suffices):
         # 1. SUBCLASS_SAFE_FUNCTIONS (set), if the numpy implementation
         #    supports Quantity; we pass on to ndarray.__array_function__.
         # 2. FUNCTION_HELPERS (dict), if the numpy implementation is usable
@@ -1500,40 +1523,40 @@ class Quantity(np.ndarray):
         # For now, since we may not yet have complete coverage, if a
         # function is in none of the above, we simply call the numpy
         # implementation.
-        if function in SUBCLASS_SAFE_FUNCTIONS:
+        helper_info = _HELPER_TABLE.get(function)
+        if helper_info is None:
+            warnings.warn("function '{}' is not known to astropy's Quantity. "
+                          "Will run it anyway, hoping it will treat ndarray "
+                          "subclasses correctly. Please raise an issue at "
+                          "https://github.com/astropy/astropy/issues. "
+                          .format(function.__name__), AstropyWarning)
+
+            return super().__array_function__(function, types, args, kwargs)
+
+        kind, helper = helper_info
+        if kind == KIND_SUBCLASS_SAFE:
             return super().__array_function__(function, types, args, kwargs)
 
-        elif function in FUNCTION_HELPERS:
-            function_helper = FUNCTION_HELPERS[function]
+        elif kind == KIND_HELPER:
             try:
-                args, kwargs, unit, out = function_helper(*args, **kwargs)
+                args, kwargs, unit, out = helper(*args, **kwargs)
             except NotImplementedError:
                 return self._not_implemented_or_raise(function, types)
 
             result = super().__array_function__(function, types, args, kwargs)
             # Fall through to return section
 
-        elif function in DISPATCHED_FUNCTIONS:
-            dispatched_function = DISPATCHED_FUNCTIONS[function]
+        elif kind == KIND_DISPATCHED:
             try:
-                result, unit, out = dispatched_function(*args, **kwargs)
+                result, unit, out = helper(*args, **kwargs)
             except NotImplementedError:
                 return self._not_implemented_or_raise(function, types)
 
             # Fall through to return section
 
-        elif function in UNSUPPORTED_FUNCTIONS:
+        else:  # KIND_UNSUPPORTED
             return NotImplemented
 
-        else:
-            warnings.warn("function '{}' is not known to astropy's Quantity. "
-                          "Will run it anyway, hoping it will treat ndarray "
-                          "subclasses correctly. Please raise an issue at "
-                          "https://github.com/astropy/astropy/issues. "
-                          .format(function.__name__), AstropyWarning)
-
-            return super().__array_function__(function, types, args, kwargs)
-
         # If unit is None, a plain array is expected (e.g., boolean), which
         # means we're done.
         # We're also done if the result was NotImplemented, which can happen
@@ -1704,6 +1727,12 @@ class Quantity(np.ndarray):
         return self._new_view(out_array)
 
 
+# Let the function helpers use Quantity directly, now that it exists;
+# they cannot import it at their module level, since they themselves get
+# imported above, before the class is defined.
+function_helpers._bind_quantity_cls(Quantity)
+
+
 class SpecificTypeQuantity(Quantity):
     """Superclass for Quantities of specific physical type.
 
@@ -37,14 +37,31 @@ return a Quantity directly using ``quantity_result, None, None``.
 
 import functools
 import operator
+from types import MappingProxyType
 
 import numpy as np
 
 from astropy.units.core import (
     UnitsError, UnitTypeError, dimensionless_unscaled)
+from astropy.units.utils import is_effectively_unity
 from astropy.utils.compat import NUMPY_LT_1_17, NUMPY_LT_1_18
 from astropy.utils import isiterable
 
+# Pre-bound so that the hot helpers pay a single global lookup instead of
+# a module attribute access on every call.
+_ndarray = np.ndarray
+
+# Quantity is set by _bind_quantity_cls once astropy.units.quantity has
+# defined it; having it as a module global rather than importing it inside
+# each helper avoids repeated sys.modules lookups in these hot functions.
+Quantity = None
+
+
+def _bind_quantity_cls(cls):
+    """Called from astropy.units.quantity to break the circular import."""
+    global Quantity
+    Quantity = cls
+
 
 if NUMPY_LT_1_17:  # pragma: no cover
     # pre 1.16, overrides.py did not exist; in 1.16, it existed, but
@@ -181,17 +198,18 @@ dispatched_function = FunctionAssigner(DISPATCHED_FUNCTIONS)
     np.fft.hfft, np.fft.ihfft,
     np.linalg.eigvals, np.linalg.eigvalsh})
 def invariant_a_helper(a, *args, **kwargs):
-    return (a.view(np.ndarray),) + args, kwargs, a.unit, None
+    # Tuple building with unpacking is faster than concatenating tuples.
+    return (_view_as_ndarray(a), *args), kwargs, a.unit, None
 
 
 @function_helper(helps={np.tril, np.triu})
 def invariant_m_helper(m, *args, **kwargs):
-    return (m.view(np.ndarray),) + args, kwargs, m.unit, None
+    return (_view_as_ndarray(m), *args), kwargs, m.unit, None
 
 
 @function_helper(helps={np.fft.fftshift, np.fft.ifftshift})
 def invariant_x_helper(x, *args, **kwargs):
-    return (x.view(np.ndarray),) + args, kwargs, x.unit, None
+    return (_view_as_ndarray(x), *args), kwargs, x.unit, None
 
 
 # Note that ones_like does *not* work by default (unlike zeros_like) since if
@@ -203,14 +221,14 @@ def invariant_x_helper(x, *args, **kwargs):
 def ones_like(a, *args, **kwargs):
     subok = args[2] if len(args) > 2 else kwargs.pop('subok', True)
     unit = a.unit if subok else None
-    return (a.view(np.ndarray),) + args, kwargs, unit, None
+    return (_view_as_ndarray(a), *args), kwargs, unit, None
 
 
 @function_helper
 def sinc(x):
     from astropy.units.si import radian
     try:
-        x = x.to_value(radian)
+        x = _to_unit_value(x, radian)
     except UnitsError:
         raise UnitTypeError("Can only apply 'sinc' function to "
                             "quantities with angle units")
@@ -219,63 +237,94 @@ def sinc(x):
 
 @dispatched_function
 def unwrap(p, discont=None, axis=-1):
+    # (Largely) copied from the numpy implementation, but generalized to
+    # an arbitrary phase jump period: rather than converting the whole
+    # array to radian and the result back again, we work in the unit of
+    # ``p`` and scale the period of the jumps (a mere scalar conversion).
     from astropy.units.si import radian
-    if discont is None:
-        discont = np.pi << radian
 
-    p, discont = _as_quantities(p, discont)
-    result = np.unwrap.__wrapped__(p.to_value(radian),
-                                   discont.to_value(radian), axis=axis)
-    result = radian.to(p.unit, result)
+    p = _as_quantity(p)
+    period = radian.to(p.unit, 2 * np.pi)
+    if discont is None:
+        discont = period / 2.
+    else:
+        discont = _to_unit_value(_as_quantity(discont), p.unit)
+
+    v = _view_as_ndarray(p)
+    half = period / 2.
+    dd = np.diff(v, axis=axis)
+    ddmod = np.mod(dd + half, period) - half
+    np.copyto(ddmod, half, where=(ddmod == -half) & (dd > 0))
+    ph_correct = ddmod - dd
+    np.copyto(ph_correct, 0., where=abs(dd) < discont)
+    result = np.array(v, copy=True, dtype=float)
+    slice1 = [slice(None)] * v.ndim
+    slice1[axis] = slice(1, None)
+    slice1 = tuple(slice1)
+    result[slice1] = v[slice1] + ph_correct.cumsum(axis)
     return result, p.unit, None
 
 
 @function_helper
 def argpartition(a, *args, **kwargs):
-    return (a.view(np.ndarray),) + args, kwargs, None, None
+    return (_view_as_ndarray(a), *args), kwargs, None, None
 
 
 @function_helper
 def full_like(a, fill_value, *args, **kwargs):
     unit = a.unit if kwargs.get('subok', True) else None
-    return (a.view(np.ndarray),
-            a._to_own_unit(fill_value)) + args, kwargs, unit, None
+    return (_view_as_ndarray(a),
+            a._to_own_unit(fill_value), *args), kwargs, unit, None
+
+
+def _own_unit_values(a, values):
+    """Convert values with _to_own_unit, fast-pathing plain arrays.
+
+    A bare ndarray counts as dimensionless, so if ``a`` is dimensionless
+    as well (and no precision can be lost in casting), the values can be
+    used as they are, without invoking the unit machinery at all.
+    """
+    if (type(values) is _ndarray
+            and a.unit is dimensionless_unscaled
+            and np.can_cast(values.dtype, a.dtype)):
+        return values
+
+    return a._to_own_unit(values)
 
 
 @function_helper
 def putmask(a, mask, values):
-    from astropy.units import Quantity
-    if isinstance(a, Quantity):
-        return (a.view(np.ndarray), mask,
-                a._to_own_unit(values)), {}, a.unit, None
+    # A type check is much faster than isinstance, and Quantity itself is
+    # far more common than its subclasses, so try that first.
+    if type(a) is Quantity or isinstance(a, Quantity):
+        return (_view_as_ndarray(a), mask,
+                _own_unit_values(a, values)), {}, a.unit, None
     elif isinstance(values, Quantity):
         return (a, mask,
-                values.to_value(dimensionless_unscaled)), {}, None, None
+                _to_unit_value(values, dimensionless_unscaled)), {}, None, None
     else:
         raise NotImplementedError
 
 
 @function_helper
 def place(arr, mask, vals):
-    from astropy.units import Quantity
-    if isinstance(arr, Quantity):
-        return (arr.view(np.ndarray), mask,
-                arr._to_own_unit(vals)), {}, arr.unit, None
+    if type(arr) is Quantity or isinstance(arr, Quantity):
+        return (_view_as_ndarray(arr), mask,
+                _own_unit_values(arr, vals)), {}, arr.unit, None
     elif isinstance(vals, Quantity):
         return (arr, mask,
-                vals.to_value(dimensionless_unscaled)), {}, None, None
+                _to_unit_value(vals, dimensionless_unscaled)), {}, None, None
     else:
         raise NotImplementedError
 
 
 @function_helper
 def copyto(dst, src, *args, **kwargs):
-    from astropy.units import Quantity
-    if isinstance(dst, Quantity):
-        return ((dst.view(np.ndarray), dst._to_own_unit(src)) + args,
+    if type(dst) is Quantity or isinstance(dst, Quantity):
+        return ((_view_as_ndarray(dst), _own_unit_values(dst, src), *args),
                 kwargs, None, None)
     elif isinstance(src, Quantity):
-        return ((dst,  src.to_value(dimensionless_unscaled)) + args,
+        return ((dst,  _to_unit_value(src, dimensionless_unscaled), *args),
                 kwargs, None, None)
     else:
         raise NotImplementedError
@@ -283,19 +332,87 @@ def copyto(dst, src, *args, **kwargs):
 
 @function_helper
 def nan_to_num(x, copy=True, nan=0.0, posinf=None, neginf=None):
-    nan = x._to_own_unit(nan)
+    to_own_unit = x._to_own_unit
+    nan = to_own_unit(nan)
     if posinf is not None:
-        posinf = x._to_own_unit(posinf)
+        posinf = to_own_unit(posinf)
     if neginf is not None:
-        neginf = x._to_own_unit(neginf)
-    return ((x.view(np.ndarray),),
+        neginf = to_own_unit(neginf)
+    return ((_view_as_ndarray(x),),
             dict(copy=True, nan=nan, posinf=posinf, neginf=neginf),
             x.unit, None)
 
 
+def _view_as_ndarray(a):
+    """Like ``a.view(np.ndarray)``, with the view cached on the instance.
+
+    The helpers frequently need plain ndarray views of the same Quantity
+    (e.g., when many small ``np.dot`` calls are made in a loop), and each
+    ``view`` call allocates a new array object.  The cached view shares
+    the data buffer, so in-place changes to either are reflected in the
+    other; it is recreated if the shape or dtype no longer match (e.g.,
+    after an in-place reshape).  The cache does create a reference cycle
+    (the instance dict holds the view, whose ``base`` is the instance),
+    so such quantities are reclaimed by the garbage collector rather
+    than by reference counting -- an acceptable price for the speed-up.
+    ``Quantity.__reduce__`` takes care not to include the cached view in
+    pickles, and ``Quantity.resize`` drops it, since its reference to
+    the data buffer would prevent resizing.
+    """
+    view = a.__dict__.get('_ndarray_view')
+    if view is None or view.shape != a.shape or view.dtype != a.dtype:
+        a._ndarray_view = view = a.view(_ndarray)
+    return view
+
+
+_converter_cache = {}
+"""Cache of unit conversion scales, keyed on the unit object ids."""
+
+
+def _to_unit_value(q, unit):
+    """Like ``q.to_value(unit)``, but with the conversion scale cached.
+
+    The helpers in this module tend to be called over and over with the
+    same pair of units, so it pays to cache the scale between them.  The
+    cache is keyed on the object ids, which is cheaper than hashing the
+    units themselves (the units are kept referenced by the cache, so the
+    ids stay valid).  Conversions that are not simple scalings may depend
+    on the currently enabled equivalencies and hence are left uncached,
+    to be dealt with by `~astropy.units.Quantity.to_value`.
+    """
+    own_unit = q.unit
+    if own_unit is unit:
+        return _view_as_ndarray(q)[()]
+
+    key = (id(own_unit), id(unit))
+    cached = _converter_cache.get(key)
+    if cached is None:
+        try:
+            scale = own_unit._to(unit)
+        except Exception:
+            # Not a simple scaling (or a function unit, which does not
+            # have _to at all); maybe equivalencies can help.
+            return q.to_value(unit)
+
+        if len(_converter_cache) > 256:  # Very unlikely, but just in case.
+            _converter_cache.clear()
+        _converter_cache[key] = cached = (scale, own_unit, unit)
+
+    scale = cached[0]
+    value = _view_as_ndarray(q)
+    if not is_effectively_unity(scale):
+        # Not in-place!
+        value = value * scale
+    # Index with empty tuple to decay array scalars into numpy scalars.
+    return value[()]
+
+
 def _as_quantity(a):
     """Convert argument to a Quantity (or raise NotImplementedError)."""
-    from astropy.units import Quantity
+    # If the argument already is a plain Quantity, no conversion is needed;
+    # checking this here avoids the relatively costly constructor call.
+    if type(a) is Quantity:
+        return a
 
     try:
         return Quantity(a, copy=False, subok=True)
@@ -306,10 +423,11 @@ def _as_quantity(a):
 
 def _as_quantities(*args):
     """Convert arguments to Quantity (or raise NotImplentedError)."""
-    from astropy.units import Quantity
-
     try:
-        return tuple(Quantity(a, copy=False, subok=True)
+        # Plain Quantity arguments can be passed through as is (see
+        # _as_quantity), which avoids the constructor call for them.
+        return tuple(a if type(a) is Quantity
+                     else Quantity(a, copy=False, subok=True)
                      for a in args)
     except Exception:
         # If we cannot convert to Quantity, we should just bail.
@@ -346,36 +464,91 @@ def _quantities2arrays(*args, unit_from_first=False):
     # We use the private _to_own_unit method here instead of just
     # converting everything to quantity and then do .to_value(qs0.unit)
     # as we want to allow arbitrary unit for 0, inf, and nan.
+    # Look up the bound method only once, so the conversion loop just
+    # does one call per argument.  Arguments that already have the right
+    # unit and a matching dtype (so that the precision check cannot
+    # matter) are by far the most common; they just need a plain view,
+    # not the conversion machinery.
+    unit = q.unit
+    dtype = q.dtype
+    to_own_unit = q._to_own_unit
     try:
-        arrays = tuple((q._to_own_unit(arg)) for arg in args)
+        arrays = tuple(_view_as_ndarray(arg)
+                       if (type(arg) is Quantity and arg.unit is unit
+                           and arg.dtype == dtype)
+                       else to_own_unit(arg)
+                       for arg in args)
     except TypeError:
         raise NotImplementedError
 
-    return arrays, q.unit
+    return arrays, unit
 
 
 def _iterable_helper(*args, out=None, **kwargs):
     """Convert arguments to Quantity, and treat possible 'out'."""
-    from astropy.units import Quantity
+    arrays, unit = _quantities2arrays(*args)
+    # The common case of no output argument needs nothing further.
+    if out is None:
+        return arrays, kwargs, unit, None
+
+    if type(out) is Quantity or isinstance(out, Quantity):
+        kwargs['out'] = _view_as_ndarray(out)
+    else:
+        # TODO: for an ndarray output, we could in principle
+        # try converting all Quantity to dimensionless.
+        raise NotImplementedError
+
+    return arrays, kwargs, unit, out
+
 
+@dispatched_function
+def concatenate(arrays, axis=0, out=None):
+    arrays, unit = _quantities2arrays(*arrays)
     if out is not None:
-        if isinstance(out, Quantity):
-            kwargs['out'] = out.view(np.ndarray)
-        else:
+        if not (type(out) is Quantity or isinstance(out, Quantity)):
             # TODO: for an ndarray output, we could in principle
             # try converting all Quantity to dimensionless.
             raise NotImplementedError
 
-    arrays, unit = _quantities2arrays(*args)
-    return arrays, kwargs, unit, out
-
+        return (np.concatenate(arrays, axis=axis, out=_view_as_ndarray(out)),
+                unit, out)
+
+    first = arrays[0]
+    ndim = first.ndim
+    if axis is None or ndim == 0 or not -ndim <= axis < ndim:
+        # Flattening concatenation, or input that will not pass the shape
+        # checks below; leave those (and their error messages) to numpy.
+        return np.concatenate(arrays, axis=axis), unit, None
+
+    if axis < 0:
+        axis += ndim
+
+    # Allocate the output array ourselves and copy each input into its
+    # own slice along axis (resolving the old TODO): we already know the
+    # shapes, dtype, and unit, so all that remains is one C-level copy
+    # per input, without np.concatenate re-inspecting the sequence.
+    shape = first.shape
+    total = 0
+    for array in arrays:
+        if (array.ndim != ndim
+                or array.shape[:axis] != shape[:axis]
+                or array.shape[axis + 1:] != shape[axis + 1:]):
+            # Mismatched input shapes; numpy gives the better error.
+            return np.concatenate(arrays, axis=axis), unit, None
+
+        total += array.shape[axis]
+
+    # Note: not np.result_type(*arrays), which is limited to 32 arguments.
+    dtype = functools.reduce(np.promote_types, (array.dtype for array in arrays))
+    result = np.empty(shape[:axis] + (total,) + shape[axis + 1:], dtype=dtype)
+    index = [slice(None)] * ndim
+    offset = 0
+    for array in arrays:
+        index[axis] = slice(offset, offset + array.shape[axis])
+        np.copyto(result[tuple(index)], array)
+        offset += array.shape[axis]
 
-@function_helper
-def concatenate(arrays, axis=0, out=None):
-    # TODO: make this smarter by creating an appropriately shaped
-    # empty output array and just filling it.
-    arrays, kwargs, unit, out = _iterable_helper(*arrays, out=out, axis=axis)
-    return (arrays,), kwargs, unit, out
+    return result, unit, None
 
 
 @dispatched_function
@@ -420,8 +593,6 @@ def select(condlist, choicelist, default=0):
 
 @dispatched_function
 def piecewise(x, condlist, funclist, *args, **kw):
-    from astropy.units import Quantity
-
     # Copied implementation from numpy.lib.function_base.piecewise,
     # taking care of units of function outputs.
     n2 = len(funclist)
@@ -470,19 +641,17 @@ def piecewise(x, condlist, funclist, *args, **kw):
 @function_helper
 def append(arr, values, *args, **kwargs):
     arrays, unit = _quantities2arrays(arr, values, unit_from_first=True)
-    return arrays + args, kwargs, unit, None
+    return (*arrays, *args), kwargs, unit, None
 
 
 @function_helper
 def insert(arr, obj, values, *args, **kwargs):
-    from astropy.units import Quantity
-
     if isinstance(obj, Quantity):
         raise NotImplementedError
 
     (arr, values), unit = _quantities2arrays(arr, values,
                                              unit_from_first=True)
-    return (arr, obj, values) + args, kwargs, unit, None
+    return (arr, obj, values, *args), kwargs, unit, None
 
 
 @function_helper
@@ -495,63 +664,90 @@ def pad(array, pad_width, mode='constant', **kwargs):
         if not isinstance(value, tuple):
             value = (value,)
 
-        new_value = []
+        # Flatten the possibly nested per-axis values, convert them to
+        # our own unit in a single batch if possible (i.e., if none has
+        # a unit of its own; conversion of plain numbers commutes with
+        # stacking them into an array, including the rule that 0, inf,
+        # and nan are acceptable for any unit), and then rebuild the
+        # original structure from the converted values.
+        flat = []
         for v in value:
-            new_value.append(
-                tuple(array._to_own_unit(_v) for _v in v)
-                if isinstance(v, tuple) else array._to_own_unit(v))
-        kwargs[key] = new_value
+            if isinstance(v, tuple):
+                flat.extend(v)
+            else:
+                flat.append(v)
 
-    return (array.view(np.ndarray), pad_width, mode), kwargs, array.unit, None
+        to_own_unit = array._to_own_unit
+        if len(flat) > 1 and not any(hasattr(_v, 'unit') for _v in flat):
+            converted = iter(to_own_unit(np.array(flat)))
+        else:
+            converted = iter([to_own_unit(_v) for _v in flat])
+
+        kwargs[key] = [tuple(next(converted) for _v in v)
+                       if isinstance(v, tuple) else next(converted)
+                       for v in value]
+
+    return (_view_as_ndarray(array), pad_width, mode), kwargs, array.unit, None
 
 
 @function_helper
 def where(condition, *args):
-    from astropy.units import Quantity
     if isinstance(condition, Quantity) or len(args) != 2:
         raise NotImplementedError
 
     args, unit = _quantities2arrays(*args)
-    return (condition,) + args, {}, unit, None
+    return (condition, *args), {}, unit, None
 
 
 @function_helper(helps=({np.quantile, np.nanquantile}))
-def quantile(a, q, *args, _q_unit=dimensionless_unscaled, **kwargs):
+def quantile(a, q, *args, **kwargs):
     if len(args) >= 2:
         out = args[1]
         args = args[:1] + args[2:]
     else:
         out = kwargs.pop('out', None)
 
-    from astropy.units import Quantity
     if isinstance(q, Quantity):
-        q = q.to_value(_q_unit)
+        q = _to_unit_value(q, dimensionless_unscaled)
 
     (a,), kwargs, unit, out = _iterable_helper(a, out=out, **kwargs)
 
-    return (a, q) + args, kwargs, unit, out
+    return (a, q, *args), kwargs, unit, out
 
 
 @function_helper(helps={np.percentile, np.nanpercentile})
 def percentile(a, q, *args, **kwargs):
+    # Identical to quantile above, except for the unit of ``q``; written
+    # out in full rather than forwarding, to save a Python frame and the
+    # repacking of the arguments on every call.
     from astropy.units import percent
-    return quantile(a, q, *args, _q_unit=percent, **kwargs)
+
+    if len(args) >= 2:
+        out = args[1]
+        args = args[:1] + args[2:]
+    else:
+        out = kwargs.pop('out', None)
+
+    if isinstance(q, Quantity):
+        q = _to_unit_value(q, percent)
+
+    (a,), kwargs, unit, out = _iterable_helper(a, out=out, **kwargs)
+
+    return (a, q, *args), kwargs, unit, out
 
 
 @function_helper
 def count_nonzero(a, *args, **kwargs):
-    return (a.value,) + args, kwargs, None, None
+    return (a.value, *args), kwargs, None, None
 
 
 @function_helper(helps={np.isclose, np.allclose})
 def close(a, b, rtol=1e-05, atol=1e-08, *args, **kwargs):
-    from astropy.units import Quantity
-
     (a, b), unit = _quantities2arrays(a, b, unit_from_first=True)
     # Allow number without a unit as having the unit.
     atol = Quantity(atol, unit).value
 
-    return (a, b, rtol, atol) + args, kwargs, None, None
+    return (a, b, rtol, atol, *args), kwargs, None, None
 
 
 @function_helper
@@ -568,30 +764,30 @@ def array_equiv(a1, a2):
 
 @function_helper(helps={np.dot, np.outer})
 def dot_like(a, b, out=None):
-    from astropy.units import Quantity
-
-    a, b = _as_quantities(a, b)
+    # Two plain Quantities is by far the most common case; the explicit
+    # check is much faster than the generic conversion machinery.
+    if not (type(a) is Quantity and type(b) is Quantity):
+        a, b = _as_quantities(a, b)
     unit = a.unit * b.unit
     if out is not None:
         if not isinstance(out, Quantity):
             raise NotImplementedError
-        return tuple(x.view(np.ndarray) for x in (a, b, out)), {}, unit, out
+        return tuple(_view_as_ndarray(x) for x in (a, b, out)), {}, unit, out
     else:
-        return (a.view(np.ndarray), b.view(np.ndarray)), {}, unit, None
+        return (_view_as_ndarray(a), _view_as_ndarray(b)), {}, unit, None
 
 
 @function_helper(helps={np.cross, np.inner, np.vdot, np.tensordot, np.kron,
                         np.correlate, np.convolve})
 def cross_like(a, b, *args, **kwargs):
-    a, b = _as_quantities(a, b)
+    if not (type(a) is Quantity and type(b) is Quantity):
+        a, b = _as_quantities(a, b)
     unit = a.unit * b.unit
-    return (a.view(np.ndarray), b.view(np.ndarray)) + args, kwargs, unit, None
+    return (_view_as_ndarray(a), _view_as_ndarray(b), *args), kwargs, unit, None
 
 
 @function_helper
 def einsum(subscripts, *operands, out=None, **kwargs):
-    from astropy.units import Quantity
-
     if not isinstance(subscripts, str):
         raise ValueError('only "subscripts" string mode supported for einsum.')
 
@@ -600,18 +796,17 @@ def einsum(subscripts, *operands, out=None, **kwargs):
             raise NotImplementedError
 
         else:
-            kwargs['out'] = out.view(np.ndarray)
+            kwargs['out'] = _view_as_ndarray(out)
 
     qs = _as_quantities(*operands)
     unit = functools.reduce(operator.mul, (q.unit for q in qs),
                             dimensionless_unscaled)
-    arrays = tuple(q.view(np.ndarray) for q in qs)
-    return (subscripts,) + arrays, kwargs, unit, out
+    arrays = tuple(_view_as_ndarray(q) for q in qs)
+    return (subscripts, *arrays), kwargs, unit, out
 
 
 @function_helper
 def bincount(x, weights=None, minlength=0):
-    from astropy.units import Quantity
     if isinstance(x, Quantity):
         raise NotImplementedError
     return (x, weights.value, minlength), {}, weights.unit, None
@@ -620,15 +815,13 @@ def bincount(x, weights=None, minlength=0):
 @function_helper
 def digitize(x, bins, *args, **kwargs):
     arrays, unit = _quantities2arrays(x, bins, unit_from_first=True)
-    return arrays + args, kwargs, None, None
+    return (*arrays, *args), kwargs, None, None
 
 
 def _check_bins(bins, unit):
-    from astropy.units import Quantity
-
     check = _as_quantity(bins)
     if check.ndim > 0:
-        return check.to_value(unit)
+        return _to_unit_value(check, unit)
     elif isinstance(bins, Quantity):
         # bins should be an integer (or at least definitely not a Quantity).
         raise NotImplementedError
@@ -668,8 +861,6 @@ def histogram_bin_edges(a, bins=10, range=None, weights=None):
 
 @function_helper
 def histogram2d(x, y, bins=10, range=None, weights=None, density=None):
-    from astropy.units import Quantity
-
     if weights is not None:
         weights = _as_quantity(weights)
         unit = weights.unit
@@ -729,8 +920,6 @@ def histogramdd(sample, bins=10, range=None, weights=None, density=None):
         M = len(bins)
     except TypeError:
         # bins should be an integer
-        from astropy.units import Quantity
-
         if isinstance(bins, Quantity):
             raise NotImplementedError
     else:
@@ -752,9 +941,9 @@ def histogramdd(sample, bins=10, range=None, weights=None, density=None):
 def diff(a, n=1, axis=-1, prepend=np._NoValue, append=np._NoValue):
     a = _as_quantity(a)
     if prepend is not np._NoValue:
-        prepend = _as_quantity(prepend).to_value(a.unit)
+        prepend = _to_unit_value(_as_quantity(prepend), a.unit)
     if append is not np._NoValue:
-        append = _as_quantity(append).to_value(a.unit)
+        append = _to_unit_value(_as_quantity(append), a.unit)
     return (a.value, n, axis, prepend, append), {}, a.unit, None
 
 
@@ -797,20 +986,18 @@ def logspace(start, stop, *args, **kwargs):
     stop = stop.to(dex(stop.unit.physical_unit))
     start = start.to(stop.unit)
     unit = stop.unit.physical_unit
-    return (start.value, stop.value) + args, kwargs, unit, None
+    return (start.value, stop.value, *args), kwargs, unit, None
 
 
 @function_helper
 def geomspace(start, stop, *args, **kwargs):
     # Get unit from end point as for linspace.
     (stop, start), unit = _quantities2arrays(stop, start)
-    return (start, stop) + args, kwargs, unit, None
+    return (start, stop, *args), kwargs, unit, None
 
 
 @function_helper
 def interp(x, xp, fp, *args, **kwargs):
-    from astropy.units import Quantity
-
     (x, xp), _ = _quantities2arrays(x, xp)
     if isinstance(fp, Quantity):
         unit = fp.unit
@@ -818,7 +1005,7 @@ def interp(x, xp, fp, *args, **kwargs):
     else:
         unit = None
 
-    return (x, xp, fp) + args, kwargs, unit, None
+    return (x, xp, fp, *args), kwargs, unit, None
 
 
 @function_helper
@@ -845,7 +1032,7 @@ def intersect1d(ar1, ar2, assume_unique=False, return_indices=False):
 @function_helper(helps=(np.setxor1d, np.union1d, np.setdiff1d))
 def twosetop(ar1, ar2, *args, **kwargs):
     (ar1, ar2), unit = _quantities2arrays(ar1, ar2)
-    return (ar1, ar2) + args, kwargs, unit, None
+    return (ar1, ar2, *args), kwargs, unit, None
 
 
 @function_helper(helps=(np.isin, np.in1d))
@@ -853,7 +1040,7 @@ def setcheckop(ar1, ar2, *args, **kwargs):
     # This tests whether ar1 is in ar2, so we should change the unit of
     # a1 to that of a2.
     (ar2, ar1), unit = _quantities2arrays(ar2, ar1)
-    return (ar1, ar2) + args, kwargs, None, None
+    return (ar1, ar2, *args), kwargs, None, None
 
 
 @dispatched_function
@@ -942,14 +1129,14 @@ def array2string(a, *args, **kwargs):
                 if 'numpy' in ff.__module__:
                     a = a.value
 
-    return (a,) + args, kwargs, None, None
+    return (a, *args), kwargs, None, None
 
 
 @function_helper
 def diag(v, *args, **kwargs):
     # Function works for *getting* the diagonal, but not *setting*.
     # So, override always.
-    return (v.value,) + args, kwargs, v.unit, None
+    return (v.value, *args), kwargs, v.unit, None
 
 
 @function_helper(module=np.linalg)
@@ -958,13 +1145,11 @@ def svd(a, full_matrices=True, compute_uv=True, hermitian=False):
     if compute_uv:
         unit = (None, unit, None)
 
-    return ((a.view(np.ndarray), full_matrices, compute_uv, hermitian),
+    return ((_view_as_ndarray(a), full_matrices, compute_uv, hermitian),
             {}, unit, None)
 
 
 def _interpret_tol(tol, unit):
-    from astropy.units import Quantity
-
     return Quantity(tol, unit).value
 
 
@@ -973,31 +1158,31 @@ def matrix_rank(M, tol=None, *args, **kwargs):
     if tol is not None:
         tol = _interpret_tol(tol, M.unit)
 
-    return (M.view(np.ndarray), tol) + args, kwargs, None, None
+    return (_view_as_ndarray(M), tol, *args), kwargs, None, None
 
 
 @function_helper(helps={np.linalg.inv, np.linalg.tensorinv})
 def inv(a, *args, **kwargs):
-    return (a.view(np.ndarray),)+args, kwargs, 1/a.unit, None
+    return (_view_as_ndarray(a), *args), kwargs, 1/a.unit, None
 
 
 @function_helper(module=np.linalg)
 def pinv(a, rcond=1e-15, *args, **kwargs):
     rcond = _interpret_tol(rcond, a.unit)
 
-    return (a.view(np.ndarray), rcond) + args, kwargs, 1/a.unit, None
+    return (_view_as_ndarray(a), rcond, *args), kwargs, 1/a.unit, None
 
 
 @function_helper(module=np.linalg)
 def det(a):
-    return (a.view(np.ndarray),), {}, a.unit ** a.shape[-1], None
+    return (_view_as_ndarray(a),), {}, a.unit ** a.shape[-1], None
 
 
 @function_helper(helps={np.linalg.solve, np.linalg.tensorsolve})
 def solve(a, b, *args, **kwargs):
     a, b = _as_quantities(a, b)
 
-    return ((a.view(np.ndarray), b.view(np.ndarray)) + args, kwargs,
+    return ((_view_as_ndarray(a), _view_as_ndarray(b), *args), kwargs,
             b.unit / a.unit, None)
 
 
@@ -1008,7 +1193,7 @@ def lstsq(a, b, rcond="warn"):
     if rcond not in (None, "warn", -1):
         rcond = _interpret_tol(rcond, a.unit)
 
-    return ((a.view(np.ndarray), b.view(np.ndarray), rcond), {},
+    return ((_view_as_ndarray(a), _view_as_ndarray(b), rcond), {},
             (b.unit / a.unit, b.unit ** 2, None, a.unit), None)
 
 
@@ -1020,7 +1205,7 @@ def norm(x, ord=None, *args, **kwargs):
         unit = dimensionless_unscaled
     else:
         unit = x.unit
-    return (x.view(np.ndarray), ord)+args, kwargs, unit, None
+    return (_view_as_ndarray(x), ord, *args), kwargs, unit, None
 
 
 @function_helper(module=np.linalg)
@@ -1050,4 +1235,44 @@ def qr(a, mode='reduced'):
 def eig(a, *args, **kwargs):
     from astropy.units import dimensionless_unscaled
 
-    return (a.value,)+args, kwargs, (a.unit, dimensionless_unscaled), None
+    return (a.value, *args), kwargs, (a.unit, dimensionless_unscaled), None
+
+
+# Kinds of entries in _HELPER_TABLE below.
+KIND_SUBCLASS_SAFE = 0
+KIND_HELPER = 1
+KIND_DISPATCHED = 2
+KIND_UNSUPPORTED = 3
+
+# Single table used by Quantity.__array_function__, so that classifying a
+# function and finding its helper costs one dict lookup plus a tuple unpack,
+# instead of up to four membership tests.  The sets and dicts above remain
+# the authoritative registries (they are also what the tests inspect); this
+# just collects them, which can be done here since all registrations happen
+# during import of this module.
+_HELPER_TABLE = {}
+_HELPER_TABLE.update((function, (KIND_SUBCLASS_SAFE, None))
+                     for function in SUBCLASS_SAFE_FUNCTIONS)
+_HELPER_TABLE.update((function, (KIND_UNSUPPORTED, None))
+                     for function in UNSUPPORTED_FUNCTIONS)
+_HELPER_TABLE.update((function, (KIND_HELPER, helper))
+                     for function, helper in FUNCTION_HELPERS.items())
+_HELPER_TABLE.update((function, (KIND_DISPATCHED, helper))
+                     for function, helper in DISPATCHED_FUNCTIONS.items())
+
+# All registrations happen while this module is imported; freeze the
+# registries afterwards, both to catch accidental late mutation and so
+# that the tables can be read from multiple threads without dict-write
+# safeguards getting in the way.
+SUBCLASS_SAFE_FUNCTIONS = frozenset(SUBCLASS_SAFE_FUNCTIONS)
+UNSUPPORTED_FUNCTIONS = frozenset(UNSUPPORTED_FUNCTIONS)
+IGNORED_FUNCTIONS = frozenset(IGNORED_FUNCTIONS)
+FUNCTION_HELPERS = MappingProxyType(FUNCTION_HELPERS)
+DISPATCHED_FUNCTIONS = MappingProxyType(DISPATCHED_FUNCTIONS)
+_HELPER_TABLE = MappingProxyType(_HELPER_TABLE)
+# Repoint the decorators at the frozen mappings as well: they keep their
+# own reference to the registry, so without this a late registration
+# would still succeed, visible in FUNCTION_HELPERS (a mappingproxy is a
+# live view) yet never reaching _HELPER_TABLE.  Now it raises instead.
+function_helper.assignments = FUNCTION_HELPERS
+dispatched_function.assignments = DISPATCHED_FUNCTIONS
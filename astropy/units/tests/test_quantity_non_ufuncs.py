@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import itertools
 import inspect
+import pickle
 
 import numpy as np
 from numpy.testing import assert_array_equal
@@ -466,6 +467,8 @@ class TestConcatenate(metaclass=CoverageMeta):
     def test_concatenate(self):
         self.check(np.concatenate)
         self.check(np.concatenate, axis=1)
+        self.check(np.concatenate, axis=-1)
+        self.check(np.concatenate, axis=None)
 
         self.check(np.concatenate, q_list=[np.zeros(self.q1.shape), self.q1, self.q2],
                    q_ref=self.q1)
@@ -478,9 +481,43 @@ class TestConcatenate(metaclass=CoverageMeta):
             [self.q1.value, self.q2.to_value(self.q1.unit)]) * self.q1.unit
         assert np.all(result == expected)
 
+        # Also with an out that already has the right unit, and whose
+        # buffer should be written through.
+        out = np.zeros((4, 3)) << self.q1.unit
+        result = np.concatenate([self.q1, self.q2], out=out)
+        assert out is result
+        assert np.all(result == expected)
+
         with pytest.raises(TypeError):
             np.concatenate([self.q1, object()])
 
+    @needs_array_function
+    def test_concatenate_dtype_promotion(self):
+        qi = np.arange(6).reshape(2, 3) * u.m
+        result = np.concatenate([qi, self.q1])
+        assert result.dtype == np.result_type(qi.value, self.q1.value)
+        assert np.all(result == np.concatenate([qi.value, self.q1.value]) << u.m)
+
+    @needs_array_function
+    def test_concatenate_many_inputs(self):
+        # More inputs than the 32-argument limit of np.result_type.
+        q_list = [self.q1 + i * u.m for i in range(40)]
+        self.check(np.concatenate, q_list=q_list)
+
+    @needs_array_function
+    def test_concatenate_exceptions(self):
+        # Mismatched shapes, 0-d input, and an out-of-range axis all get
+        # numpy's own errors.
+        with pytest.raises(ValueError):
+            np.concatenate([self.q1, self.q2[:, :2]])
+        with pytest.raises(ValueError):
+            np.concatenate([1. * u.m, 2. * u.cm])
+        with pytest.raises(np.AxisError):
+            np.concatenate([self.q1, self.q2], axis=2)
+        # Incompatible units cannot be concatenated.
+        with pytest.raises(u.UnitConversionError):
+            np.concatenate([self.q1, np.arange(3.) * u.s])
+
     @needs_array_function
     def test_stack(self):
         self.check(np.stack)
@@ -2038,6 +2075,57 @@ class TestLinAlg(metaclass=CoverageMeta):
         assert_array_equal(w, wx)
 
 
+class TestNdarrayViewCache(metaclass=CoverageMeta):
+    """The helpers cache a plain ndarray view on the Quantity instance."""
+
+    def setup(self):
+        self.q = np.arange(6.).reshape(2, 3) * u.m
+
+    @needs_array_function
+    def test_view_reused(self):
+        np.ones_like(self.q)
+        view = self.q.__dict__['_ndarray_view']
+        assert type(view) is np.ndarray
+        assert np.shares_memory(view, self.q)
+        # A second helper call should reuse the very same view.
+        np.tril(self.q)
+        assert self.q.__dict__['_ndarray_view'] is view
+
+    @needs_array_function
+    def test_view_invalidated_on_shape_change(self):
+        np.ones_like(self.q)
+        view = self.q.__dict__['_ndarray_view']
+        self.q.shape = (3, 2)
+        np.ones_like(self.q)
+        new_view = self.q.__dict__['_ndarray_view']
+        assert new_view is not view
+        assert new_view.shape == (3, 2)
+
+    @needs_array_function
+    def test_resize_drops_cached_view(self):
+        q = (np.arange(6.) * u.m).copy()  # resize needs owned data.
+        np.ones_like(q)
+        assert '_ndarray_view' in q.__dict__
+        q.resize(12)
+        assert '_ndarray_view' not in q.__dict__
+        assert q.shape == (12,)
+        # An actual view should still prevent resizing.
+        q2 = (np.arange(6.) * u.m).copy()
+        view = q2[::2]
+        with pytest.raises(ValueError):
+            q2.resize(12)
+
+    @needs_array_function
+    def test_cached_view_not_pickled(self):
+        np.ones_like(self.q)
+        assert '_ndarray_view' in self.q.__dict__
+        copy = pickle.loads(pickle.dumps(self.q))
+        assert '_ndarray_view' not in copy.__dict__
+        assert_array_equal(copy, self.q)
+        # And the original keeps its cache.
+        assert '_ndarray_view' in self.q.__dict__
+
+
 untested_functions = set()
 financial_functions = {f for f in all_wrapped_functions.values()
                        if f in np.lib.financial.__dict__.values()}
@@ -2089,3 +2177,16 @@ class TestFunctionHelpersCompleteness:
     @needs_array_function
     def test_ignored_are_untested(self):
         assert IGNORED_FUNCTIONS == untested_functions
+
+    def test_registries_frozen(self):
+        # The registries are frozen once this module is imported; any
+        # later registration attempt should fail loudly, since it could
+        # not take effect in __array_function__ anyway.
+        from astropy.units.quantity_helper.function_helpers import (
+            function_helper, dispatched_function)
+
+        with pytest.raises(TypeError):
+            function_helper(lambda x: x, helps={np.concatenate})
+
+        with pytest.raises(TypeError):
+            dispatched_function(lambda x: x, helps={np.concatenate})